@@ -130,6 +130,13 @@ USERS_RESOURCES_MODERATION_LOCK_DEFAULT_TIMEOUT = 30
 USERS_RESOURCES_MODERATION_LOCK_RENEWAL_TIMEOUT = 120
 """Renewal timeout, in seconds, to increase the lock time for a user when moderating."""
 
+USERS_RESOURCES_MODERATION_INDEX_REFRESH = True
+"""Refresh the users index after each moderation action.
+
+Disable it to save one refresh per moderation request, at the cost of the change
+only becoming visible in searches after the index refresh interval.
+"""
+
 
 USERS_RESOURCES_DOMAINS_SEARCH = {
     "sort": [
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 CERN.
+#
+# Invenio-Users-Resources is free software; you can redistribute it and/or
+# modify it under the terms of the MIT License; see LICENSE file for more
+# details.
+
+"""Avatar responses for users and groups."""
+
+from io import BytesIO
+
+from flask import request, send_file
+from werkzeug.http import is_resource_modified
+
+
+def send_avatar(avatar, max_age=None):
+    """Send an avatar, rendering it only if the client's copy is stale."""
+    max_age = avatar.max_age if max_age is None else max_age
+    last_modified = avatar.last_modified
+
+    # ``send_file`` answers a matching conditional request with a 304 carrying
+    # the same validator and cache headers, so an empty body is enough then
+    modified = is_resource_modified(
+        request.environ, etag=avatar.etag, last_modified=last_modified
+    )
+    return send_file(
+        avatar.bytes_io if modified else BytesIO(),
+        mimetype=avatar.mimetype,
+        as_attachment=False,
+        download_name=avatar.name,
+        etag=avatar.etag,
+        last_modified=last_modified,
+        max_age=max_age,
+    )
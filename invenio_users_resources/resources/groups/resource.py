@@ -11,7 +11,7 @@
 """User groups resource."""
 
 
-from flask import g, send_file
+from flask import g
 from flask_resources import resource_requestctx, response_handler, route
 from invenio_records_resources.resources import RecordResource
 from invenio_records_resources.resources.records.resource import (
@@ -20,6 +20,8 @@ from invenio_records_resources.resources.records.resource import (
 )
 from invenio_records_resources.resources.records.utils import search_preference
 
+from ..avatars import send_avatar
+
 
 #
 # Resource
@@ -65,12 +67,4 @@ class GroupsResource(RecordResource):
             name_=resource_requestctx.view_args["id"],
             identity=g.identity,
         )
-        return send_file(
-            avatar.bytes_io,
-            mimetype=avatar.mimetype,
-            as_attachment=False,
-            download_name=avatar.name,
-            etag=avatar.etag,
-            last_modified=avatar.last_modified,
-            max_age=86400 * 7,
-        )
+        return send_avatar(avatar, max_age=86400 * 7)
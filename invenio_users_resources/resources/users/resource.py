@@ -10,7 +10,7 @@
 
 """Users resource."""
 
-from flask import g, send_file
+from flask import g
 from flask_resources import resource_requestctx, response_handler, route
 from flask_security import impersonate_user
 from invenio_records_resources.resources import RecordResource
@@ -20,6 +20,8 @@ from invenio_records_resources.resources.records.resource import (
 )
 from invenio_records_resources.resources.records.utils import search_preference
 
+from ..avatars import send_avatar
+
 
 #
 # Resource
@@ -88,15 +90,7 @@ class UsersResource(RecordResource):
             id_=resource_requestctx.view_args["id"],
             identity=g.identity,
         )
-        return send_file(
-            avatar.bytes_io,
-            mimetype=avatar.mimetype,
-            as_attachment=False,
-            download_name=avatar.name,
-            etag=avatar.etag,
-            last_modified=avatar.last_modified,
-            max_age=avatar.max_age,
-        )
+        return send_avatar(avatar)
 
     @request_view_args
     def approve(self):
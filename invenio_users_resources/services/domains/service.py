@@ -14,6 +14,7 @@
 from invenio_accounts.models import Domain
 from invenio_db import db
 from invenio_records_resources.services import RecordService
+from sqlalchemy import select
 
 
 class DomainsService(RecordService):
@@ -21,6 +22,8 @@ class DomainsService(RecordService):
 
     def rebuild_index(self, identity, uow=None):
         """Reindex all user groups managed by this service."""
-        domains = db.session.query(Domain.domain).yield_per(1000)
-        self.indexer.bulk_index([r[0] for r in domains])
+        domains = db.session.execute(
+            select(Domain.domain).execution_options(yield_per=1000)
+        ).scalars()
+        self.indexer.bulk_index(domains)
         return True
@@ -13,7 +13,6 @@
 
 from flask import current_app
 from invenio_access.permissions import any_user
-from invenio_records.dictutils import dict_lookup
 from invenio_records_permissions.generators import (
     ConditionalGenerator,
     Generator,
@@ -29,6 +28,10 @@ class IfPublic(ConditionalGenerator):
         """Constructor."""
         super().__init__(then_=then_, else_=else_, **kwargs)
         self._field_name = field_name
+        # the visibility filters only depend on the field, build them once
+        self._field = f"preferences.{field_name}"
+        self._q_public = dsl.Q("match", **{self._field: "public"})
+        self._q_restricted = dsl.Q("match", **{self._field: "restricted"})
 
     def _condition(self, record=None, **kwargs):
         """Condition to choose generators set."""
@@ -42,9 +45,8 @@ class IfPublic(ConditionalGenerator):
 
     def query_filter(self, **kwargs):
         """Filters for queries."""
-        field = f"preferences.{self._field_name}"
-        q_public = dsl.Q("match", **{field: "public"})
-        q_restricted = dsl.Q("match", **{field: "restricted"})
+        q_public = self._q_public
+        q_restricted = self._q_restricted
         then_query = self._make_query(self.then_, **kwargs)
         else_query = self._make_query(self.else_, **kwargs)
 
@@ -107,22 +109,21 @@ class IfGroupNotManaged(ConditionalGenerator):
         if record is None:
             return False
 
-        is_managed = dict_lookup(record, self._field_name)
+        # aggregates resolve keys from their model, see BaseAggregate
+        is_managed = record[self._field_name]
         return not is_managed
 
     def query_filter(self, **kwargs):
         """Filters for queries."""
-        q_all = dsl.Q("match_all")
         q_not_managed = dsl.Q("match", **{self._field_name: False})
         then_query = self._make_query(self.then_, **kwargs)
         else_query = self._make_query(self.else_, **kwargs)
 
         identity = kwargs.get("identity", None)
 
-        if identity:
-            for need in self.needs(**kwargs):
-                if need in identity.provides:
-                    return q_all & else_query
+        if identity and not identity.provides.isdisjoint(self.needs(**kwargs)):
+            # managers see every group, no need to wrap it in a match_all
+            return else_query
 
         return q_not_managed & then_query
 
@@ -138,15 +139,14 @@ class GroupsEnabled(Generator):
 
     def __init__(self, *need_groups_enabled_types):
         """Types that need the groups enabled."""
-        self.need_groups_enabled_types = need_groups_enabled_types
+        self.need_groups_enabled_types = frozenset(need_groups_enabled_types)
 
     def excludes(self, member_types=None, **kwargs):
         """Preventing needs."""
+        if current_app.config["USERS_RESOURCES_GROUPS_ENABLED"]:
+            return []
+
         member_types = member_types or {"group"}
-        for m in member_types:
-            if (
-                m in self.need_groups_enabled_types
-                and not current_app.config["USERS_RESOURCES_GROUPS_ENABLED"]
-            ):
-                return [any_user]
+        if not self.need_groups_enabled_types.isdisjoint(member_types):
+            return [any_user]
         return []
@@ -15,6 +15,7 @@ from invenio_accounts.models import Role
 from invenio_db import db
 from invenio_records_resources.resources.errors import PermissionDeniedError
 from invenio_records_resources.services import RecordService
+from sqlalchemy import select
 
 from ...records.api import GroupAggregate
 from ..results import AvatarResult
@@ -34,9 +35,7 @@ class GroupsService(RecordService):
         self.require_permission(identity, "read", record=group)
 
         # run components
-        for component in self.components:
-            if hasattr(component, "read"):
-                component.read(identity, group=group)
+        self.run_components("read", identity, group=group)
 
         return self.result_item(self, identity, group, links_tpl=self.links_item_tpl)
 
@@ -51,8 +50,11 @@ class GroupsService(RecordService):
 
     def rebuild_index(self, identity, uow=None):
         """Reindex all user groups managed by this service."""
-        roles = db.session.query(Role.id).yield_per(1000)
+        roles = db.session.execute(
+            select(Role.id).execution_options(yield_per=1000)
+        ).scalars()
 
-        self.indexer.bulk_index([r.id for r in roles])
+        # stream the ids, the indexer only queues them one by one
+        self.indexer.bulk_index(roles)
 
         return True
@@ -192,6 +192,9 @@ class UsersServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     schema = FromConfig("USERS_RESOURCES_SERVICE_SCHEMA", UserSchema)
     indexer_queue_name = "users"
     index_dumper = None
+    moderation_index_refresh = FromConfig(
+        "USERS_RESOURCES_MODERATION_INDEX_REFRESH", default=True
+    )
 
     # links configuration
     links_item = {
@@ -18,6 +18,7 @@ from invenio_records_resources.services import RecordService
 from invenio_records_resources.services.uow import RecordCommitOp, TaskOp, unit_of_work
 from invenio_search.engine import dsl
 from marshmallow import ValidationError
+from sqlalchemy import select
 
 from invenio_users_resources.services.results import AvatarResult
 from invenio_users_resources.services.users.tasks import execute_moderation_actions
@@ -108,9 +109,7 @@ class UsersService(RecordService):
         self.require_permission(identity, "read", record=user)
 
         # run components
-        for component in self.components:
-            if hasattr(component, "read"):
-                component.read(identity, user=user)
+        self.run_components("read", identity, user=user)
 
         return self.result_item(self, identity, user, links_tpl=self.links_item_tpl)
 
@@ -125,10 +124,20 @@ class UsersService(RecordService):
 
     def rebuild_index(self, identity, uow=None):
         """Reindex all users managed by this service."""
-        users = db.session.query(User.id).yield_per(1000)
-        self.indexer.bulk_index([u.id for u in users])
+        users = db.session.execute(
+            select(User.id).execution_options(yield_per=1000)
+        ).scalars()
+        self.indexer.bulk_index(users)
         return True
 
+    def _moderation_commit_op(self, user):
+        """Commit operation for a moderated user."""
+        return RecordCommitOp(
+            user,
+            indexer=self.indexer,
+            index_refresh=self.config.moderation_index_refresh,
+        )
+
     @unit_of_work()
     def block(self, identity, id_, uow=None):
         """Blocks a user."""
@@ -145,7 +154,7 @@ class UsersService(RecordService):
         # Throws if not acquired
         ModerationMutex(id_).acquire()
         user.block()
-        uow.register(RecordCommitOp(user, indexer=self.indexer, index_refresh=True))
+        uow.register(self._moderation_commit_op(user))
 
         # Register a task to execute callback actions asynchronously, after committing the user
         uow.register(
@@ -170,7 +179,7 @@ class UsersService(RecordService):
         ModerationMutex(id_).acquire()
         user.activate()
         # User is blocked from now on, "after" actions are executed separately.
-        uow.register(RecordCommitOp(user, indexer=self.indexer, index_refresh=True))
+        uow.register(self._moderation_commit_op(user))
 
         # Register a task to execute callback actions asynchronously, after committing the user
         uow.register(
@@ -194,7 +203,7 @@ class UsersService(RecordService):
         # Throws if not acquired
         ModerationMutex(id_).acquire()
         user.verify()
-        uow.register(RecordCommitOp(user, indexer=self.indexer, index_refresh=True))
+        uow.register(self._moderation_commit_op(user))
 
         # Register a task to execute callback actions asynchronously, after committing the user
         uow.register(
@@ -215,7 +224,7 @@ class UsersService(RecordService):
             raise ValidationError("User is already inactive.")
 
         user.deactivate()
-        uow.register(RecordCommitOp(user, indexer=self.indexer, index_refresh=True))
+        uow.register(self._moderation_commit_op(user))
         return True
 
     @unit_of_work()
@@ -229,7 +238,7 @@ class UsersService(RecordService):
         if user.active and user.confirmed:
             raise ValidationError("User is already active.")
         user.activate()
-        uow.register(RecordCommitOp(user, indexer=self.indexer, index_refresh=True))
+        uow.register(self._moderation_commit_op(user))
         return True
 
     def can_impersonate(self, identity, id_):
@@ -313,6 +313,12 @@ def groups(database, group, group2, not_managed_group):
     return roles
 
 
+@pytest.fixture(scope="module")
+def unmanaged_groups_count(groups):
+    """Number of groups which are not managed."""
+    return sum(1 for g in groups if not g.is_managed)
+
+
 @pytest.fixture(scope="module")
 def user_pub(users):
     """User jbenito (restricted/restricted)."""
@@ -370,6 +376,32 @@ def clear_cache():
     current_cache.cache.clear()
 
 
+@pytest.fixture(scope="function")
+def assert_avatar_not_modified(monkeypatch):
+    """Assert conditional avatar requests are answered without rendering."""
+
+    def render_template(*args, **kwargs):
+        pytest.fail("avatar rendered for a conditional request")
+
+    def _assert(client, url, res):
+        etag = res.headers["ETag"]
+        with monkeypatch.context() as m:
+            m.setattr(
+                "invenio_users_resources.services.results.render_template",
+                render_template,
+            )
+            for if_none_match in (etag, f"W/{etag}"):
+                cached = client.get(url, headers={"If-None-Match": if_none_match})
+                assert cached.status_code == 304
+                assert cached.headers["ETag"] == etag
+                assert cached.headers["Cache-Control"] == res.headers["Cache-Control"]
+                assert "Last-Modified" in cached.headers
+                assert "Expires" in cached.headers
+                assert cached.get_data() == b""
+
+    return _assert
+
+
 @pytest.fixture(scope="module")
 def domains_data():
     """Data for domains."""
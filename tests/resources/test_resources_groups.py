@@ -9,23 +9,28 @@
 """Groups resource tests."""
 
 
-def test_group_avatar(app, client, group, not_managed_group, user_pub):
+def test_group_avatar(
+    app, client, group, not_managed_group, user_pub, assert_avatar_not_modified
+):
     res = client.get(f"/groups/{not_managed_group.name}/avatar.svg")
     assert res.status_code == 403
 
     user_pub.login(client)
 
     # unmanaged group can be retrieved
-    res = client.get(f"/groups/{not_managed_group.name}/avatar.svg")
+    url = f"/groups/{not_managed_group.name}/avatar.svg"
+    res = client.get(url)
     assert res.status_code == 200
     assert res.mimetype == "image/svg+xml"
     data = res.get_data()
 
+    # conditional request with a matching etag is not rendered again
+    assert_avatar_not_modified(client, url, res)
+
     # managed group can *not* be retrieved
     res = client.get(f"/groups/{group.name}/avatar.svg")
     assert res.status_code == 403
 
 
-# TODO: test conditional requests
 # TODO: test caching headers
 # TODO: test invalid identifiers
@@ -105,12 +105,16 @@ def test_read_anon_serialization(client, headers, users, username, public_email)
 #
 # Avatar
 #
-def test_user_avatar(client, user_pub):
-    res = client.get(f"/users/{user_pub.id}/avatar.svg")
+def test_user_avatar(client, user_pub, assert_avatar_not_modified):
+    url = f"/users/{user_pub.id}/avatar.svg"
+    res = client.get(url)
     assert res.status_code == 200
     assert res.mimetype == "image/svg+xml"
     data = res.get_data()
 
+    # conditional request with a matching etag is not rendered again
+    assert_avatar_not_modified(client, url, res)
+
 
 #
 # Management / moderation
@@ -36,24 +36,26 @@ def test_groups_fixed_pagination(app, groups, group_service):
     assert res.pagination.size == 10
 
 
-@pytest.mark.parametrize(
-    "query",
-    [
-        # cannot search on title because is never set
-        # see TODO in parse_role_data
-        "id:it-dep",
-        "name:IT Department",
-        "+name:it",
-        "IT",
-    ],
+# cannot search on title because is never set
+# see TODO in parse_role_data
+_SEARCH_QUERIES = (
+    "id:it-dep",
+    "name:IT Department",
+    "+name:it",
+    "IT",
 )
+
+
+@pytest.mark.parametrize("query", _SEARCH_QUERIES)
 def test_groups_search_field(app, group, group_service, query):
     """Make sure certain fields ARE searchable."""
     res = group_service.search(system_identity, q=query)
     assert res.total > 0
 
 
-def test_groups_search(app, groups, group_service, user_pub, anon_identity):
+def test_groups_search(
+    app, groups, unmanaged_groups_count, group_service, user_pub, anon_identity
+):
     """Test group search."""
 
     # System can retrieve all groups.
@@ -62,29 +64,51 @@ def test_groups_search(app, groups, group_service, user_pub, anon_identity):
 
     # Authenticated user can retrieve unmanaged groups
     res = group_service.search(user_pub.identity).to_dict()
-    assert res["hits"]["total"] == len([g for g in groups if not g.is_managed])
+    assert res["hits"]["total"] == unmanaged_groups_count
 
     # Anon does not have permission to search
     with pytest.raises(PermissionDeniedError):
         group_service.search(anon_identity).to_dict()
 
 
-def test_groups_read(app, groups, group_service, user_pub, anon_identity):
-    """Test group read."""
-
-    from invenio_accounts.models import Role
-
-    for g in groups:
+@pytest.mark.parametrize(
+    "group_name,identity_name,can_read",
+    [
         # System can retrieve all groups.
-        group_service.read(system_identity, g.name).to_dict()
-
+        ("it-dep", "system", True),
+        ("hr-dep", "system", True),
+        ("not-managed-dep", "system", True),
         # Authenticated user can retrieve unmanaged groups
-        if g.is_managed:
-            with pytest.raises(PermissionDeniedError):
-                group_service.read(user_pub.identity, g.name).to_dict()
-        else:
-            group_service.read(user_pub.identity, g.name).to_dict()
-
-        # Anon does not have permission to search
+        ("it-dep", "user", False),
+        ("hr-dep", "user", False),
+        ("not-managed-dep", "user", True),
+        # Anon does not have permission to read
+        ("it-dep", "anon", False),
+        ("hr-dep", "anon", False),
+        ("not-managed-dep", "anon", False),
+    ],
+)
+def test_groups_read(
+    app,
+    groups,
+    group_service,
+    user_pub,
+    anon_identity,
+    group_name,
+    identity_name,
+    can_read,
+):
+    """Test group read."""
+    identity = {
+        "system": system_identity,
+        "user": user_pub.identity,
+        "anon": anon_identity,
+    }[identity_name]
+
+    if can_read:
+        res = group_service.read(identity, group_name).to_dict()
+        assert res["id"] == group_name
+        assert res["links"]["self"].endswith(f"/groups/{group_name}")
+    else:
         with pytest.raises(PermissionDeniedError):
-            group_service.read(anon_identity, g.name).to_dict()
+            group_service.read(identity, group_name)
@@ -17,24 +17,33 @@ from invenio_cache.proxies import current_cache
 from invenio_records_resources.services.errors import PermissionDeniedError
 
 from invenio_users_resources.proxies import current_actions_registry
+from invenio_users_resources.services.users import service as service_module
 
 
 @pytest.fixture(scope="function", autouse=True)
-def mock_action_registry(monkeypatch, user_service):
+def mock_action_registry(user_service):
     """Mocks action to registry entirely.
 
-    Monkeypatches the registry to be modified only for testing.
+    Empties the registry for the duration of the test and restores it afterwards.
     """
-
-    for key in current_actions_registry:
-        monkeypatch.setitem(current_actions_registry, key, [])
-    return True
+    original = dict(current_actions_registry)
+    for key in original:
+        current_actions_registry[key] = []
+    yield True
+    current_actions_registry.clear()
+    current_actions_registry.update(original)
 
 
 #
 # Search
 #
-def test_search_restricted(user_service, anon_identity, user_pub):
+@pytest.fixture(scope="module")
+def public_search_result(user_service, user_pub):
+    """Search results of an authenticated user without any query."""
+    return user_service.search(user_pub.identity)
+
+
+def test_search_restricted(user_service, anon_identity, public_search_result):
     """Only authenticated users can search."""
     # Anon identity
     pytest.raises(
@@ -44,14 +53,15 @@ def test_search_restricted(user_service, anon_identity, user_pub):
         anon_identity,
     )
     # Authenticated identity
-    res = user_service.search(user_pub.identity).to_dict()
-    assert res["hits"]["total"] > 0
+    assert public_search_result.total > 0
 
 
-def test_search_public_users(user_service, user_pub):
+def test_search_public_users(public_search_result):
     """Only public users are shown in search."""
-    res = user_service.search(user_pub.identity).to_dict()
-    assert res["hits"]["total"] == 2  # 2 public users in conftest
+    res = public_search_result.to_dict()
+    # 2 public users in conftest
+    assert res["hits"]["total"] == 2
+    assert len(res["hits"]["hits"]) == 2
 
 
 # Admin search
@@ -74,8 +84,16 @@ def test_search_public_users(user_service, user_pub):
 )
 def test_admin_search_field(user_service, user_moderator, query):
     """Make sure certain fields ARE searchable."""
-    res = user_service.search_all(user_moderator.identity, q=query).to_dict()
-    assert res["hits"]["total"] > 0
+    res = user_service.search_all(user_moderator.identity, q=query)
+    assert res.total > 0
+
+
+def test_admin_search_serialization(user_service, user_moderator):
+    """Moderator search results are serialized with their hits."""
+    res = user_service.search_all(user_moderator.identity, q="username:pub").to_dict()
+    hits = res["hits"]["hits"]
+    assert len(hits) == res["hits"]["total"]
+    assert "pub" in [hit["username"] for hit in hits]
 
 
 # User search
@@ -94,8 +112,8 @@ def test_admin_search_field(user_service, user_moderator, query):
 )
 def test_user_search_field_not_searchable(user_service, user_pub, query):
     """Make sure certain fields are NOT searchable."""
-    res = user_service.search(user_pub.identity, suggest=query).to_dict()
-    assert res["hits"]["total"] == 0
+    res = user_service.search(user_pub.identity, suggest=query)
+    assert res.total == 0
 
 
 @pytest.mark.parametrize(
@@ -114,8 +132,8 @@ def test_user_search_field_not_searchable(user_service, user_pub, query):
 )
 def test_user_search_field(user_service, user_pub, query):
     """Make sure certain fields ARE searchable."""
-    res = user_service.search(user_pub.identity, suggest=query).to_dict()
-    assert res["hits"]["total"] > 0
+    res = user_service.search(user_pub.identity, suggest=query)
+    assert res.total > 0
 
 
 #
@@ -175,7 +193,15 @@ def test_read_self(user_service, users, username):
     user_service.read_avatar(user.identity, user.id)
 
 
-def test_search_permissions(app, db, user_service, user_moderator, user_res):
+@pytest.fixture(scope="module")
+def user_res_query(user_res):
+    """Search query matching the restricted user's username."""
+    return f"username:{user_res._user.username}"
+
+
+def test_search_permissions(
+    app, db, user_service, user_moderator, user_res, user_res_query
+):
     """Test service search for permissions."""
     # User can search for himself
     search = user_service.search(
@@ -190,20 +216,28 @@ def test_search_permissions(app, db, user_service, user_moderator, user_res):
         user_service.search_all(user_res.identity, user_res.id)
 
     # Moderator can search for any user
-    search = user_service.search_all(
-        user_moderator.identity, q=f"username:{user_res._user.username}"
-    )
+    search = user_service.search_all(user_moderator.identity, q=user_res_query)
     assert search.total > 0
 
 
+@pytest.mark.parametrize("action", ["block", "approve", "deactivate", "restore"])
+def test_self_moderation_denied(user_service, user_res, action):
+    """Users can't moderate themselves."""
+    with pytest.raises(PermissionDeniedError):
+        getattr(user_service, action)(user_res.identity, user_res.id)
+
+
 def test_block(
-    app, db, user_service, user_moderator, user_res, clear_cache, search_clear
+    app,
+    db,
+    user_service,
+    user_moderator,
+    user_res,
+    user_res_query,
+    clear_cache,
+    search_clear,
 ):
     """Test user block."""
-
-    with pytest.raises(PermissionDeniedError):
-        user_service.block(user_res.identity, user_res.id)
-
     blocked = user_service.block(user_moderator.identity, user_res.id)
     assert blocked
 
@@ -222,9 +256,7 @@ def test_block(
     # assert search.total == 0
 
     # Moderator can still search for the user
-    search = user_service.search_all(
-        user_moderator.identity, q=f"username:{user_res._user.username}"
-    )
+    search = user_service.search_all(user_moderator.identity, q=user_res_query)
     assert search.total > 0
 
 
@@ -232,9 +264,6 @@ def test_approve(
     app, db, user_service, user_res, user_moderator, clear_cache, search_clear
 ):
     """Test approval of an user."""
-    with pytest.raises(PermissionDeniedError):
-        user_service.block(user_res.identity, user_res.id)
-
     approved = user_service.approve(user_moderator.identity, user_res.id)
     assert approved
 
@@ -249,11 +278,10 @@ def test_approve(
     assert "verified_at" in ur.data
 
 
-def test_deactivate(app, db, user_service, user_res, user_moderator, clear_cache):
+def test_deactivate(
+    app, db, user_service, user_res, user_moderator, user_res_query, clear_cache
+):
     """Test deactivation of an user."""
-    with pytest.raises(PermissionDeniedError):
-        user_service.block(user_res.identity, user_res.id)
-
     deactivated = user_service.deactivate(user_moderator.identity, user_res.id)
     assert deactivated
 
@@ -262,24 +290,37 @@ def test_deactivate(app, db, user_service, user_res, user_moderator, clear_cache
     assert ur.data["active"] is False
 
     # Moderator can still search for the user
-    search = user_service.search_all(
-        user_moderator.identity, q=f"username:{user_res._user.username}"
-    )
+    search = user_service.search_all(user_moderator.identity, q=user_res_query)
     assert search.total > 0
 
 
-def test_non_existent_user_management(app, db, user_service, user_moderator):
+def test_moderation_index_refresh(
+    app, db, user_service, user_res, user_moderator, clear_cache, monkeypatch
+):
+    """Moderation actions honour the index refresh setting."""
+    index_refresh = []
+
+    class RecordCommitOp(service_module.RecordCommitOp):
+        def __init__(self, *args, **kwargs):
+            index_refresh.append(kwargs.get("index_refresh"))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(service_module, "RecordCommitOp", RecordCommitOp)
+    monkeypatch.setitem(app.config, "USERS_RESOURCES_MODERATION_INDEX_REFRESH", False)
+
+    actions = ["block", "restore", "approve", "deactivate", "activate"]
+    for action in actions:
+        assert getattr(user_service, action)(user_moderator.identity, user_res.id)
+
+    assert index_refresh == [False] * len(actions)
+
+
+@pytest.mark.parametrize("action", ["block", "approve", "deactivate", "restore"])
+def test_non_existent_user_management(app, db, user_service, user_moderator, action):
     """Try to manage a non-existent user."""
     fake_user_id = 1000
-    funcs = [
-        user_service.block,
-        user_service.approve,
-        user_service.deactivate,
-        user_service.restore,
-    ]
-    for f in funcs:
-        with pytest.raises(PermissionDeniedError):
-            f(user_moderator.identity, fake_user_id)
+    with pytest.raises(PermissionDeniedError):
+        getattr(user_service, action)(user_moderator.identity, fake_user_id)
 
 
 def test_restore(app, db, user_service, user_res, user_moderator, clear_cache):